@@ -6,7 +6,10 @@ from pathlib import Path
 
 import pytest
 
-from trader.rules.models import Rule, RuleAction, RuleCondition
+import numpy as np
+import yaml
+
+from trader.rules.models import Rule, RuleAction, RuleCondition, RuleTable
 from trader.rules.loader import (
     load_rules,
     save_rule,
@@ -106,6 +109,34 @@ def test_rule_check_above_triggered() -> None:
     assert rule.check(Decimal("199.99")) is False
 
 
+def test_rule_check_ticks_boundaries() -> None:
+    """Test tick-based checks agree with Decimal checks at the boundary."""
+    rule = Rule(
+        symbol="AAPL",
+        action=RuleAction.BUY,
+        condition=RuleCondition.BELOW,
+        target_price=Decimal("170.00"),
+        quantity=10,
+    )
+    assert rule.check_ticks(1699900) is True
+    assert rule.check_ticks(1700000) is True
+    assert rule.check_ticks(1700001) is False
+
+
+def test_rule_check_ticks_rounds_subtick_target() -> None:
+    """Test sub-tick targets round to the nearest tick instead of truncating."""
+    rule = Rule(
+        symbol="AAPL",
+        action=RuleAction.SELL,
+        condition=RuleCondition.ABOVE,
+        target_price=Decimal("1.00005"),
+        quantity=1,
+    )
+    # 1.00005 rounds to 10001 ticks, not down to 10000
+    assert rule.check_ticks(10001) is True
+    assert rule.check_ticks(10000) is False
+
+
 def test_rule_check_disabled() -> None:
     """Test disabled rule doesn't trigger."""
     rule = Rule(
@@ -276,6 +307,88 @@ def test_enable_disable_rule(temp_config_dir: Path) -> None:
     assert found.enabled is True
 
 
+def test_load_migrates_legacy_yaml(temp_config_dir: Path) -> None:
+    """Test rules in a legacy rules.yaml are loaded and migrated to JSON."""
+    rule1 = Rule(
+        id="legacy1",
+        symbol="AAPL",
+        action=RuleAction.BUY,
+        condition=RuleCondition.BELOW,
+        target_price=Decimal("170.00"),
+        quantity=10,
+    )
+    rule2 = Rule(
+        id="legacy2",
+        symbol="TSLA",
+        action=RuleAction.SELL,
+        condition=RuleCondition.ABOVE,
+        target_price=Decimal("300.00"),
+        quantity=5,
+    )
+    legacy_file = temp_config_dir / "rules.yaml"
+    with open(legacy_file, "w") as f:
+        yaml.dump({"rules": [rule1.to_dict(), rule2.to_dict()]}, f)
+
+    loaded = load_rules(temp_config_dir)
+
+    assert [r.id for r in loaded] == ["legacy1", "legacy2"]
+    assert loaded[0].target_price == Decimal("170.00")
+    assert (temp_config_dir / "rules.json").exists()
+
+    # Subsequent loads read the migrated JSON file
+    assert [r.id for r in load_rules(temp_config_dir)] == ["legacy1", "legacy2"]
+
+
+def test_rule_table_check_all() -> None:
+    """Test batch evaluation matches single-rule checks."""
+    rules = [
+        Rule(
+            symbol="AAPL",
+            action=RuleAction.BUY,
+            condition=RuleCondition.BELOW,
+            target_price=Decimal("170.00"),
+            quantity=10,
+        ),
+        Rule(
+            symbol="TSLA",
+            action=RuleAction.SELL,
+            condition=RuleCondition.ABOVE,
+            target_price=Decimal("300.00"),
+            quantity=5,
+        ),
+    ]
+    table = RuleTable.from_rules(rules)
+    prices = np.array([169.50, 301.00])
+
+    fired = table.check_all(prices)
+    assert fired.tolist() == [True, True]
+    assert table.fired_indices(np.array([170.50, 299.00])).tolist() == []
+
+
+def test_rule_table_skips_inactive_rules() -> None:
+    """Test disabled and already-triggered rules never fire in batch checks."""
+    rules = [
+        Rule(
+            symbol="AAPL",
+            action=RuleAction.BUY,
+            condition=RuleCondition.BELOW,
+            target_price=Decimal("170.00"),
+            quantity=10,
+            enabled=False,
+        ),
+        Rule(
+            symbol="TSLA",
+            action=RuleAction.SELL,
+            condition=RuleCondition.ABOVE,
+            target_price=Decimal("300.00"),
+            quantity=5,
+            triggered=True,
+        ),
+    ]
+    table = RuleTable.from_rules(rules)
+    assert table.check_all(np.array([100.00, 400.00])).tolist() == [False, False]
+
+
 def test_load_empty_rules(temp_config_dir: Path) -> None:
     """Test loading rules when none exist."""
     loaded = load_rules(temp_config_dir)
@@ -1,16 +1,18 @@
 """Simple backtesting engine."""
 
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from decimal import Decimal
 from datetime import datetime, timedelta
 from typing import Optional
-import random
+
+import numpy as np
 
 from trader.rules.models import Rule, RuleAction, RuleCondition
 from trader.utils.logging import get_logger
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestTrade:
     """Simulated trade during backtest."""
 
@@ -22,7 +24,7 @@ class BacktestTrade:
     rule_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     """Results from a backtest run."""
 
@@ -79,45 +81,54 @@ class Backtester:
         cash = self.initial_capital
         positions: dict[str, tuple[int, Decimal]] = {}  # symbol -> (qty, avg_price)
         trades: list[BacktestTrade] = []
-        equity_curve: list[Decimal] = [self.initial_capital]
+        equity_curve: list[float] = [float(self.initial_capital)]
 
         # Generate simulated prices starting from rule targets
-        symbols = list(set(r.symbol for r in rules))
-        prices: dict[str, Decimal] = {}
+        rng = np.random.default_rng()
+        symbols = sorted(set(r.symbol for r in rules))
+        sym_to_col = {s: i for i, s in enumerate(symbols)}
+
+        start_prices = np.empty(len(symbols))
+        seen: set[str] = set()
         for rule in rules:
-            if rule.symbol not in prices:
+            if rule.symbol not in seen:
+                seen.add(rule.symbol)
                 # Start price near the target
-                offset = Decimal(str(random.uniform(-0.1, 0.1)))
-                prices[rule.symbol] = rule.target_price * (1 + offset)
+                offset = rng.uniform(-0.1, 0.1)
+                start_prices[sym_to_col[rule.symbol]] = rule.target_price_f * (1.0 + offset)
 
-        start_date = datetime.now() - timedelta(days=days)
-        end_date = datetime.now()
+        # Full random-walk price paths, floored at $1, shape (days, n_symbols)
+        changes = rng.normal(0.0, float(volatility), size=(days, len(symbols)))
+        price_paths = np.maximum(np.cumprod(1.0 + changes, axis=0) * start_prices[None, :], 1.0)
 
-        # Simulate each day
-        for day in range(days):
-            current_date = start_date + timedelta(days=day)
+        # Pack rule attributes into aligned arrays; sign * (price - target) >= 0
+        # is equivalent to the ABOVE/BELOW branch, so the entire (days, rules)
+        # trigger grid is evaluated in one vectorized pass and the Python day
+        # loop below only visits cells that actually fire.
+        rule_cols = np.array([sym_to_col[r.symbol] for r in rules])
+        targets = np.array([r.target_price_f for r in rules])
+        signs = np.array([1.0 if r.condition == RuleCondition.ABOVE else -1.0 for r in rules])
+        enabled_mask = np.array([r.enabled for r in rules])
 
-            # Update prices with random walk
-            for symbol in symbols:
-                change = Decimal(str(random.gauss(0, float(volatility))))
-                prices[symbol] = prices[symbol] * (1 + change)
-                prices[symbol] = max(prices[symbol], Decimal("1"))  # Floor at $1
+        trigger_grid = (signs * (price_paths[:, rule_cols] - targets) >= 0.0) & enabled_mask
+        trigger_days = trigger_grid.any(axis=1)
 
-            # Check rules
-            for rule in rules:
-                if not rule.enabled:
-                    continue
+        # Share counts per symbol column, mirroring the positions dict, so the
+        # daily mark-to-market is one dot product instead of per-position Decimals
+        pos_qty = np.zeros(len(symbols))
 
-                current_price = prices[rule.symbol]
+        start_date = datetime.now() - timedelta(days=days)
+        end_date = datetime.now()
 
-                # Check if rule triggers
-                triggered = False
-                if rule.condition == RuleCondition.BELOW and current_price <= rule.target_price:
-                    triggered = True
-                elif rule.condition == RuleCondition.ABOVE and current_price >= rule.target_price:
-                    triggered = True
+        # Simulate each day, touching only days with at least one trigger
+        for day in range(days):
+            if trigger_days[day]:
+                current_date = start_date + timedelta(days=day)
 
-                if triggered:
+                for idx in np.flatnonzero(trigger_grid[day]):
+                    rule = rules[idx]
+                    col = rule_cols[idx]
+                    current_price = Decimal(f"{price_paths[day, col]:.4f}")
                     if rule.action == RuleAction.BUY:
                         # Buy if we have enough cash
                         cost = current_price * rule.quantity
@@ -130,6 +141,7 @@ class Backtester:
                                 positions[rule.symbol] = (new_qty, new_avg)
                             else:
                                 positions[rule.symbol] = (rule.quantity, current_price)
+                            pos_qty[col] += rule.quantity
 
                             trades.append(BacktestTrade(
                                 timestamp=current_date,
@@ -151,6 +163,7 @@ class Backtester:
                                 del positions[rule.symbol]
                             else:
                                 positions[rule.symbol] = (qty - sell_qty, avg_price)
+                            pos_qty[col] -= sell_qty
 
                             trades.append(BacktestTrade(
                                 timestamp=current_date,
@@ -162,29 +175,26 @@ class Backtester:
                             ))
 
             # Calculate equity
-            positions_value = sum(
-                prices[s] * Decimal(str(q)) for s, (q, _) in positions.items()
-            )
-            equity = cash + positions_value
-            equity_curve.append(equity)
-
-        # Calculate final metrics
-        final_capital = equity_curve[-1]
+            equity_curve.append(float(cash) + float(price_paths[day] @ pos_qty))
+
+        # Calculate final metrics; final capital is marked to market in Decimal
+        final_positions_value = sum(
+            Decimal(f"{price_paths[-1, sym_to_col[s]]:.4f}") * q for s, (q, _) in positions.items()
+        )
+        final_capital = cash + final_positions_value
         total_return = final_capital - self.initial_capital
         total_return_pct = total_return / self.initial_capital
 
         # Calculate win/loss
         winning = 0
         losing = 0
-        # Pair up buys and sells
-        buy_prices: dict[str, list[Decimal]] = {}
+        # Pair up buys and sells (FIFO)
+        buy_prices: dict[str, deque[Decimal]] = defaultdict(deque)
         for trade in trades:
             if trade.side == "buy":
-                if trade.symbol not in buy_prices:
-                    buy_prices[trade.symbol] = []
                 buy_prices[trade.symbol].append(trade.price)
-            elif trade.side == "sell" and trade.symbol in buy_prices and buy_prices[trade.symbol]:
-                buy_price = buy_prices[trade.symbol].pop(0)
+            elif trade.side == "sell" and buy_prices[trade.symbol]:
+                buy_price = buy_prices[trade.symbol].popleft()
                 if trade.price > buy_price:
                     winning += 1
                 else:
@@ -193,15 +203,10 @@ class Backtester:
         total_completed = winning + losing
         win_rate = Decimal(str(winning / total_completed)) if total_completed > 0 else Decimal("0")
 
-        # Calculate max drawdown
-        peak = equity_curve[0]
-        max_drawdown = Decimal("0")
-        for equity in equity_curve:
-            if equity > peak:
-                peak = equity
-            drawdown = (peak - equity) / peak
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
+        # Calculate max drawdown in one vectorized pass over the equity curve
+        eq = np.asarray(equity_curve)
+        peaks = np.maximum.accumulate(eq)
+        max_drawdown = Decimal(f"{((peaks - eq) / peaks).max():.6f}")
 
         return BacktestResult(
             start_date=start_date,
@@ -7,7 +7,8 @@ from typing import Optional
 
 from trader.api.broker import Broker
 from trader.rules.evaluator import RuleEvaluator
-from trader.rules.loader import load_rules
+from trader.rules.loader import get_rules_file, load_rules
+from trader.rules.models import Rule
 from trader.utils.logging import get_logger
 
 
@@ -34,6 +35,10 @@ class TradingEngine:
         self.logger = get_logger("autotrader.engine")
         self._running = False
         self._stop_requested = False
+        # Active-rule list memoized by rules file signature so an unchanged
+        # file costs a stat per cycle instead of a reload and re-filter
+        self._rules_signature: Optional[tuple[int, int]] = None
+        self._active_rules: list[Rule] = []
 
     def start(self) -> None:
         """Start the trading engine loop."""
@@ -67,21 +72,44 @@ class TradingEngine:
 
     def _run_loop(self) -> None:
         """Main trading loop."""
-        while not self._stop_requested:
-            cycle_start = time.time()
+        # Anchor cycles to a monotonic schedule so intervals don't drift
+        # with cycle duration and aren't affected by wall-clock jumps
+        next_tick = time.monotonic()
 
+        while not self._stop_requested:
             try:
                 self._run_cycle()
             except Exception as e:
                 self.logger.error(f"Error in trading cycle: {e}")
 
-            # Sleep until next interval
-            elapsed = time.time() - cycle_start
-            sleep_time = max(0, self.poll_interval - elapsed)
+            # Sleep until the next scheduled tick
+            next_tick += self.poll_interval
+            sleep_time = next_tick - time.monotonic()
 
-            if sleep_time > 0 and not self._stop_requested:
+            if sleep_time <= 0:
+                # Cycle overran the interval; restart the schedule from now
+                next_tick = time.monotonic()
+            elif not self._stop_requested:
                 time.sleep(sleep_time)
 
+    def _get_active_rules(self) -> list[Rule]:
+        """Get enabled, untriggered rules, reloading only when the file changed.
+
+        Returns:
+            List of active rules.
+        """
+        try:
+            st = get_rules_file().stat()
+            signature: Optional[tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            signature = None
+
+        if signature is None or signature != self._rules_signature:
+            self._active_rules = [r for r in load_rules() if r.enabled and not r.triggered]
+            self._rules_signature = signature
+
+        return self._active_rules
+
     def _run_cycle(self) -> None:
         """Run a single evaluation cycle."""
         # Check if market is open
@@ -90,8 +118,7 @@ class TradingEngine:
             return
 
         # Load current rules
-        rules = load_rules()
-        active_rules = [r for r in rules if r.enabled and not r.triggered]
+        active_rules = self._get_active_rules()
 
         if not active_rules:
             self.logger.debug("No active rules")
@@ -100,7 +127,7 @@ class TradingEngine:
         self.logger.debug(f"Evaluating {len(active_rules)} active rules")
 
         # Evaluate and execute
-        order_ids = self.evaluator.run_once(dry_run=self.dry_run)
+        order_ids = self.evaluator.run_once(dry_run=self.dry_run, rules=active_rules)
 
         if order_ids:
             self.logger.info(f"Executed {len(order_ids)} orders: {order_ids}")
@@ -1,6 +1,7 @@
 """Safety controls for trading."""
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Optional
 
@@ -8,16 +9,29 @@ from trader.api.broker import Broker
 from trader.data.ledger import TradeLedger
 from trader.utils.logging import get_logger
 
+# Shared success result so passing checks don't allocate a tuple per call;
+# failure reasons are formatted only on the (cold) rejection branches
+_OK: tuple[bool, str] = (True, "OK")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SafetyLimits:
-    """Safety limit configuration."""
+    """Safety limit configuration.
+
+    Frozen so derived values can't drift from the limits they mirror;
+    build a new instance to change a limit.
+    """
 
     max_position_size: int = 100  # Max shares per position
     max_position_value: Decimal = Decimal("10000")  # Max $ per position
     max_daily_loss: Decimal = Decimal("500")  # Max daily loss before stopping
     max_daily_trades: int = 50  # Max trades per day
     max_order_value: Decimal = Decimal("5000")  # Max $ per single order
+    # Integer-cents mirror of max_order_value for the hot comparison
+    max_order_value_cents: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "max_order_value_cents", int(self.max_order_value * 100))
 
 
 class SafetyCheck:
@@ -41,6 +55,9 @@ class SafetyCheck:
         self.limits = limits or SafetyLimits()
         self.logger = get_logger("autotrader.safety")
         self._killed = False
+        # (timestamp, daily_pnl, trade_count) snapshot so a burst of order
+        # checks doesn't rescan the ledger for every order
+        self._stats_cache: Optional[tuple[float, Decimal, int]] = None
 
     def kill(self) -> None:
         """Activate kill switch - stops all trading."""
@@ -57,6 +74,24 @@ class SafetyCheck:
         """Check if kill switch is active."""
         return self._killed
 
+    _STATS_TTL = 1.0  # seconds before daily stats are re-read from the ledger
+
+    def _daily_stats(self) -> tuple[Decimal, int]:
+        """Get today's (pnl, trade_count), cached for a short window.
+
+        Returns:
+            Tuple of (daily_pnl, trade_count).
+        """
+        now = time.monotonic()
+        cached = self._stats_cache
+        if cached is not None and now - cached[0] < self._STATS_TTL:
+            return cached[1], cached[2]
+
+        daily_pnl = self.ledger.get_total_today_pnl()
+        trade_count = self.ledger.get_trade_count_today()
+        self._stats_cache = (now, daily_pnl, trade_count)
+        return daily_pnl, trade_count
+
     def check_can_trade(self) -> tuple[bool, str]:
         """Check if trading is allowed.
 
@@ -66,23 +101,21 @@ class SafetyCheck:
         if self._killed:
             return False, "Kill switch is active"
 
+        daily_pnl, trade_count = self._daily_stats()
+
         # Check daily loss limit
-        daily_pnl = self.ledger.get_total_today_pnl()
         if daily_pnl < -self.limits.max_daily_loss:
-            self.logger.warning(
-                f"Daily loss limit reached: ${daily_pnl:.2f} (limit: -${self.limits.max_daily_loss})"
-            )
-            return False, f"Daily loss limit reached: ${daily_pnl:.2f}"
+            reason = f"Daily loss limit reached: ${daily_pnl:.2f}"
+            self.logger.warning(f"{reason} (limit: -${self.limits.max_daily_loss})")
+            return False, reason
 
         # Check daily trade count
-        trade_count = self.ledger.get_trade_count_today()
         if trade_count >= self.limits.max_daily_trades:
-            self.logger.warning(
-                f"Daily trade limit reached: {trade_count} (limit: {self.limits.max_daily_trades})"
-            )
-            return False, f"Daily trade limit reached: {trade_count} trades"
+            reason = f"Daily trade limit reached: {trade_count} trades"
+            self.logger.warning(f"{reason} (limit: {self.limits.max_daily_trades})")
+            return False, reason
 
-        return True, "OK"
+        return _OK
 
     def check_order(
         self,
@@ -107,10 +140,17 @@ class SafetyCheck:
         if not can_trade:
             return False, reason
 
-        order_value = Decimal(str(quantity)) * price
-
-        # Check order value limit
-        if order_value > self.limits.max_order_value:
+        # Check order value limit; int-cents arithmetic when the price has no
+        # sub-cent precision, Decimal fallback otherwise
+        price_cents_d = price * 100
+        price_cents = int(price_cents_d)
+        if price_cents == price_cents_d:
+            too_large = quantity * price_cents > self.limits.max_order_value_cents
+        else:
+            too_large = Decimal(quantity) * price > self.limits.max_order_value
+
+        if too_large:
+            order_value = Decimal(quantity) * price
             return False, f"Order value ${order_value:.2f} exceeds limit ${self.limits.max_order_value}"
 
         # Check quantity limit
@@ -119,6 +159,8 @@ class SafetyCheck:
 
         # For buys, check position limits
         if is_buy:
+            order_value = Decimal(quantity) * price
+
             # Check if this would exceed position value limit
             current_position = self.broker.get_position(symbol)
             current_value = Decimal("0")
@@ -137,7 +179,7 @@ class SafetyCheck:
             if order_value > account.buying_power:
                 return False, f"Insufficient buying power: need ${order_value:.2f}, have ${account.buying_power:.2f}"
 
-        return True, "OK"
+        return _OK
 
     def get_status(self) -> dict:
         """Get current safety status.
@@ -145,8 +187,7 @@ class SafetyCheck:
         Returns:
             Dict with safety metrics.
         """
-        daily_pnl = self.ledger.get_total_today_pnl()
-        trade_count = self.ledger.get_trade_count_today()
+        daily_pnl, trade_count = self._daily_stats()
 
         return {
             "kill_switch": self._killed,
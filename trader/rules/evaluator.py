@@ -4,8 +4,10 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional
 
+import numpy as np
+
 from trader.api.broker import Broker, OrderSide, OrderType
-from trader.rules.models import Rule, RuleAction
+from trader.rules.models import Rule, RuleAction, RuleTable
 from trader.rules.loader import load_rules, mark_triggered
 from trader.utils.logging import get_logger
 
@@ -35,6 +37,27 @@ class RuleEvaluator:
         """
         self.broker = broker
         self.logger = get_logger("autotrader.rules")
+        # Batch table reused across cycles; see _get_table
+        self._table: Optional[RuleTable] = None
+        self._table_source: Optional[list[Rule]] = None
+
+    def _get_table(self, rules: list[Rule]) -> RuleTable:
+        """Get the batch table for a rules list, rebuilding only on change.
+
+        The engine passes the same memoized list object every cycle until
+        the rules file changes, so at steady state the table's packed
+        arrays and buffers survive across ticks instead of being rebuilt.
+
+        Args:
+            rules: Rules to evaluate.
+
+        Returns:
+            RuleTable over the active (enabled, untriggered) rules.
+        """
+        if self._table is None or self._table_source is not rules:
+            self._table = RuleTable([r for r in rules if r.enabled and not r.triggered])
+            self._table_source = rules
+        return self._table
 
     def evaluate(self, rules: Optional[list[Rule]] = None) -> list[Signal]:
         """Evaluate rules and generate signals.
@@ -50,28 +73,43 @@ class RuleEvaluator:
 
         signals: list[Signal] = []
 
-        for rule in rules:
-            if not rule.enabled or rule.triggered:
-                continue
+        table = self._get_table(rules)
+        active_rules = table.rules
+        if not active_rules:
+            return signals
 
+        # Fetch each symbol's quote once per evaluation instead of once per rule
+        price_by_symbol: dict[str, Decimal] = {}
+        for symbol in dict.fromkeys(r.symbol for r in active_rules):
             try:
-                quote = self.broker.get_quote(rule.symbol)
+                quote = self.broker.get_quote(symbol)
                 # Use midpoint as current price
-                current_price = (quote.bid + quote.ask) / 2
-
-                if rule.check(current_price):
-                    self.logger.info(
-                        f"Rule triggered: {rule.id} | {rule.symbol} @ ${current_price:.2f} "
-                        f"(target: ${rule.target_price})"
-                    )
-                    signals.append(Signal(
-                        rule=rule,
-                        current_price=current_price,
-                        action=rule.action,
-                    ))
-
+                price_by_symbol[symbol] = (quote.bid + quote.ask) / 2
             except Exception as e:
-                self.logger.error(f"Error evaluating rule {rule.id}: {e}")
+                self.logger.error(f"Error fetching quote for {symbol}: {e}")
+
+        if not price_by_symbol:
+            return signals
+
+        # Batch-check every rule against its symbol's price in one pass;
+        # symbols without a quote get NaN, which never satisfies a condition
+        prices = np.array([
+            float(price_by_symbol[r.symbol]) if r.symbol in price_by_symbol else float("nan")
+            for r in active_rules
+        ])
+
+        for idx in table.fired_indices(prices):
+            rule = active_rules[idx]
+            current_price = price_by_symbol[rule.symbol]
+            self.logger.info(
+                f"Rule triggered: {rule.id} | {rule.symbol} @ ${current_price:.2f} "
+                f"(target: ${rule.target_price})"
+            )
+            signals.append(Signal(
+                rule=rule,
+                current_price=current_price,
+                action=rule.action,
+            ))
 
         return signals
 
@@ -117,16 +155,17 @@ class RuleEvaluator:
             self.logger.error(f"Error executing signal for rule {rule.id}: {e}")
             return None
 
-    def run_once(self, dry_run: bool = False) -> list[str]:
+    def run_once(self, dry_run: bool = False, rules: Optional[list[Rule]] = None) -> list[str]:
         """Evaluate all rules and execute signals.
 
         Args:
             dry_run: If True, don't actually place orders.
+            rules: Rules to evaluate. If None, loads from config.
 
         Returns:
             List of order IDs for executed signals.
         """
-        signals = self.evaluate()
+        signals = self.evaluate(rules)
 
         if not signals:
             self.logger.debug("No rules triggered")
@@ -1,8 +1,10 @@
 """Rule loading and persistence."""
 
+import os
 from pathlib import Path
 from typing import Optional
 
+import orjson
 import yaml
 
 from trader.rules.models import Rule
@@ -13,45 +15,228 @@ def get_rules_file(config_dir: Optional[Path] = None) -> Path:
     if config_dir is None:
         config_dir = Path(__file__).parent.parent.parent / "config"
     config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir / "rules.yaml"
+    return config_dir / "rules.json"
 
 
-def load_rules(config_dir: Optional[Path] = None) -> list[Rule]:
-    """Load all rules from YAML file.
+def _get_legacy_rules_file(rules_file: Path) -> Path:
+    """Get path to the pre-JSON YAML rules file next to rules_file."""
+    return rules_file.with_name("rules.yaml")
+
+
+class RuleStore:
+    """In-memory rule index backed by the rules file.
+
+    Rules are held in an insertion-ordered {id: Rule} dict so lookups,
+    updates and deletes are O(1) instead of scanning the list, and bulk
+    operations write the file once instead of once per rule. The store
+    stats the file before reads and reloads only when the
+    (st_mtime_ns, st_size) signature changed, so a poll loop calling
+    list_rules() every cycle costs a stat() when nothing changed.
+    """
+
+    def __init__(self, config_dir: Optional[Path] = None) -> None:
+        """Initialize store.
+
+        Args:
+            config_dir: Config directory path.
+        """
+        self._rules_file = get_rules_file(config_dir)
+        self._rules: dict[str, Rule] = {}
+        self._signature: Optional[tuple[int, int]] = None
+        self._checked_legacy = False
+
+    def _refresh(self) -> None:
+        """Reload rules from disk if the file changed since last read."""
+        try:
+            st = self._rules_file.stat()
+        except FileNotFoundError:
+            self._rules = {}
+            self._signature = None
+            # Probe for a pre-JSON rules.yaml once per store, not per poll
+            if not self._checked_legacy:
+                self._checked_legacy = True
+                self._migrate_legacy()
+            return
+
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature == self._signature:
+            return
+
+        data = orjson.loads(self._rules_file.read_bytes())
+        # The JSON file is our own output, so the unvalidated fast path is safe
+        rules = [Rule.from_dict_fast(r) for r in data["rules"]] if data and "rules" in data else []
+        self._rules = {r.id: r for r in rules}
+        self._signature = signature
+
+    def _migrate_legacy(self) -> None:
+        """Load rules from the legacy YAML file, migrating them to JSON."""
+        legacy_file = _get_legacy_rules_file(self._rules_file)
+        if not legacy_file.exists():
+            return
+
+        with open(legacy_file) as f:
+            data = yaml.safe_load(f)
+
+        if not data or "rules" not in data:
+            return
+
+        rules = [Rule.from_dict(r) for r in data["rules"]]
+        self._rules = {r.id: r for r in rules}
+        self._flush()
+
+    def _flush(self) -> None:
+        """Write all rules to disk atomically and record the new file signature."""
+        data = {"rules": [r.to_dict() for r in self._rules.values()]}
+        # Write to a sibling temp file and rename so a crash mid-write can't
+        # leave a truncated rules file behind
+        tmp_file = self._rules_file.with_suffix(self._rules_file.suffix + ".tmp")
+        tmp_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, self._rules_file)
+        st = self._rules_file.stat()
+        self._signature = (st.st_mtime_ns, st.st_size)
+
+    def list_rules(self) -> list[Rule]:
+        """Get all rules in file order.
+
+        Returns:
+            List of Rule objects.
+        """
+        self._refresh()
+        return list(self._rules.values())
+
+    def replace_all(self, rules: list[Rule]) -> None:
+        """Replace the entire rule set and write once.
+
+        Args:
+            rules: New rule set.
+        """
+        self._rules = {r.id: r for r in rules}
+        self._flush()
+
+    def save_rule(self, rule: Rule) -> None:
+        """Add or update a single rule.
+
+        Args:
+            rule: Rule to save.
+        """
+        self._refresh()
+        self._rules[rule.id] = rule
+        self._flush()
+
+    def upsert_rules(self, rules: list[Rule]) -> None:
+        """Add or update multiple rules with a single write.
+
+        Args:
+            rules: Rules to add or update.
+        """
+        self._refresh()
+        for rule in rules:
+            self._rules[rule.id] = rule
+        self._flush()
+
+    def delete_rule(self, rule_id: str) -> bool:
+        """Delete a rule by ID.
+
+        Args:
+            rule_id: Rule ID to delete.
+
+        Returns:
+            True if rule was deleted, False if not found.
+        """
+        self._refresh()
+        if self._rules.pop(rule_id, None) is None:
+            return False
+        self._flush()
+        return True
+
+    def get_rule(self, rule_id: str) -> Optional[Rule]:
+        """Get a rule by ID.
+
+        Args:
+            rule_id: Rule ID to find.
+
+        Returns:
+            Rule if found, None otherwise.
+        """
+        self._refresh()
+        return self._rules.get(rule_id)
+
+    def enable_rule(self, rule_id: str, enabled: bool = True) -> bool:
+        """Enable or disable a rule.
+
+        Args:
+            rule_id: Rule ID.
+            enabled: Whether to enable or disable.
+
+        Returns:
+            True if rule was updated, False if not found.
+        """
+        rule = self.get_rule(rule_id)
+        if rule is None:
+            return False
+        rule.enabled = enabled
+        self._flush()
+        return True
+
+    def mark_triggered(self, rule_id: str) -> bool:
+        """Mark a rule as triggered (prevents re-triggering).
+
+        Args:
+            rule_id: Rule ID.
+
+        Returns:
+            True if rule was updated, False if not found.
+        """
+        rule = self.get_rule(rule_id)
+        if rule is None:
+            return False
+        rule.triggered = True
+        self._flush()
+        return True
+
+
+# Store singletons keyed by rules file path so all callers sharing a
+# config_dir share one index (and one parse) of the file.
+_STORES: dict[Path, RuleStore] = {}
+
+
+def get_store(config_dir: Optional[Path] = None) -> RuleStore:
+    """Get the shared RuleStore for a config directory.
 
     Args:
         config_dir: Config directory path.
 
     Returns:
-        List of Rule objects.
+        RuleStore instance for that directory.
     """
-    rules_file = get_rules_file(config_dir)
+    key = get_rules_file(config_dir)
+    store = _STORES.get(key)
+    if store is None:
+        store = RuleStore(config_dir)
+        _STORES[key] = store
+    return store
 
-    if not rules_file.exists():
-        return []
 
-    with open(rules_file) as f:
-        data = yaml.safe_load(f)
+def load_rules(config_dir: Optional[Path] = None) -> list[Rule]:
+    """Load all rules from the rules file.
 
-    if not data or "rules" not in data:
-        return []
+    Args:
+        config_dir: Config directory path.
 
-    return [Rule.from_dict(r) for r in data["rules"]]
+    Returns:
+        List of Rule objects.
+    """
+    return get_store(config_dir).list_rules()
 
 
 def save_rules(rules: list[Rule], config_dir: Optional[Path] = None) -> None:
-    """Save all rules to YAML file.
+    """Save all rules to the rules file.
 
     Args:
         rules: List of rules to save.
         config_dir: Config directory path.
     """
-    rules_file = get_rules_file(config_dir)
-
-    data = {"rules": [r.to_dict() for r in rules]}
-
-    with open(rules_file, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    get_store(config_dir).replace_all(rules)
 
 
 def save_rule(rule: Rule, config_dir: Optional[Path] = None) -> None:
@@ -61,21 +246,17 @@ def save_rule(rule: Rule, config_dir: Optional[Path] = None) -> None:
         rule: Rule to save.
         config_dir: Config directory path.
     """
-    rules = load_rules(config_dir)
+    get_store(config_dir).save_rule(rule)
 
-    # Check if rule with same ID exists
-    existing_idx = None
-    for i, r in enumerate(rules):
-        if r.id == rule.id:
-            existing_idx = i
-            break
 
-    if existing_idx is not None:
-        rules[existing_idx] = rule
-    else:
-        rules.append(rule)
+def upsert_rules(rules: list[Rule], config_dir: Optional[Path] = None) -> None:
+    """Add or update multiple rules with a single write.
 
-    save_rules(rules, config_dir)
+    Args:
+        rules: Rules to add or update.
+        config_dir: Config directory path.
+    """
+    get_store(config_dir).upsert_rules(rules)
 
 
 def delete_rule(rule_id: str, config_dir: Optional[Path] = None) -> bool:
@@ -88,16 +269,7 @@ def delete_rule(rule_id: str, config_dir: Optional[Path] = None) -> bool:
     Returns:
         True if rule was deleted, False if not found.
     """
-    rules = load_rules(config_dir)
-    original_count = len(rules)
-
-    rules = [r for r in rules if r.id != rule_id]
-
-    if len(rules) == original_count:
-        return False
-
-    save_rules(rules, config_dir)
-    return True
+    return get_store(config_dir).delete_rule(rule_id)
 
 
 def get_rule(rule_id: str, config_dir: Optional[Path] = None) -> Optional[Rule]:
@@ -110,11 +282,7 @@ def get_rule(rule_id: str, config_dir: Optional[Path] = None) -> Optional[Rule]:
     Returns:
         Rule if found, None otherwise.
     """
-    rules = load_rules(config_dir)
-    for r in rules:
-        if r.id == rule_id:
-            return r
-    return None
+    return get_store(config_dir).get_rule(rule_id)
 
 
 def enable_rule(rule_id: str, enabled: bool = True, config_dir: Optional[Path] = None) -> bool:
@@ -128,13 +296,7 @@ def enable_rule(rule_id: str, enabled: bool = True, config_dir: Optional[Path] =
     Returns:
         True if rule was updated, False if not found.
     """
-    rule = get_rule(rule_id, config_dir)
-    if rule is None:
-        return False
-
-    rule.enabled = enabled
-    save_rule(rule, config_dir)
-    return True
+    return get_store(config_dir).enable_rule(rule_id, enabled)
 
 
 def mark_triggered(rule_id: str, config_dir: Optional[Path] = None) -> bool:
@@ -147,10 +309,4 @@ def mark_triggered(rule_id: str, config_dir: Optional[Path] = None) -> bool:
     Returns:
         True if rule was updated, False if not found.
     """
-    rule = get_rule(rule_id, config_dir)
-    if rule is None:
-        return False
-
-    rule.triggered = True
-    save_rule(rule, config_dir)
-    return True
+    return get_store(config_dir).mark_triggered(rule_id)
@@ -1,11 +1,14 @@
 """Rule models for trading automation."""
 
 from dataclasses import dataclass, field
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from enum import Enum
-from typing import Optional
+from operator import ge, le
+from typing import Callable, Optional
 import uuid
 
+import numpy as np
+
 
 class RuleAction(Enum):
     """Action to take when rule triggers."""
@@ -21,7 +24,32 @@ class RuleCondition(Enum):
     ABOVE = "above"  # Trigger when price rises above target
 
 
-@dataclass
+# Integer price scale: 1/10000 of a currency unit, enough for sub-cent quotes
+TICKS_PER_UNIT = 10_000
+
+# Lookup tables for (de)serialization, cheaper than Enum's value/member machinery
+_ACTION_BY_VALUE = {a.value: a for a in RuleAction}
+_CONDITION_BY_VALUE = {c.value: c for c in RuleCondition}
+_ACTION_VALUE = {a: a.value for a in RuleAction}
+_CONDITION_VALUE = {c: c.value for c in RuleCondition}
+_CONDITION_GLYPH = {RuleCondition.BELOW: "≤", RuleCondition.ABOVE: "≥"}
+
+try:
+    # Optional accelerator: with numba installed the batch rule check compiles
+    # to a parallel native loop; without it RuleTable uses plain NumPy
+    from numba import njit, prange
+
+    @njit(cache=True, parallel=True)
+    def _check_all_kernel(prices, targets, directions, mask, out):  # pragma: no cover
+        for i in prange(prices.shape[0]):
+            out[i] = mask[i] and directions[i] * (prices[i] - targets[i]) >= 0.0
+        return out
+
+except ImportError:
+    _check_all_kernel = None
+
+
+@dataclass(slots=True)
 class Rule:
     """Trading rule definition.
 
@@ -37,10 +65,15 @@ class Rule:
     condition: RuleCondition
     target_price: Decimal
     quantity: int
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:8])
     enabled: bool = True
     triggered: bool = False
     description: Optional[str] = None
+    # Derived in __post_init__, excluded from init/repr/comparison
+    target_price_f: float = field(init=False, repr=False, compare=False)
+    _target_ticks: int = field(init=False, repr=False, compare=False)
+    _sign: int = field(init=False, repr=False, compare=False)
+    _cmp: Callable = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate rule after initialization."""
@@ -49,6 +82,16 @@ class Rule:
             raise ValueError("Quantity must be positive")
         if self.target_price <= 0:
             raise ValueError("Target price must be positive")
+        # Mirrors of target_price for hot-path comparisons; the Decimal stays
+        # canonical for serialization, orders and logging
+        self.target_price_f = float(self.target_price)
+        self._target_ticks = int(
+            (self.target_price * TICKS_PER_UNIT).to_integral_value(rounding=ROUND_HALF_UP)
+        )
+        # Condition as a sign: sign * (price - target) >= 0 means triggered
+        self._sign = -1 if self.condition == RuleCondition.BELOW else 1
+        # Specialized comparator so check needs no arithmetic at all
+        self._cmp = le if self._sign < 0 else ge
 
     def check(self, current_price: Decimal) -> bool:
         """Check if rule should trigger based on current price.
@@ -62,18 +105,33 @@ class Rule:
         if not self.enabled or self.triggered:
             return False
 
-        if self.condition == RuleCondition.BELOW:
-            return current_price <= self.target_price
-        else:  # ABOVE
-            return current_price >= self.target_price
+        return self._cmp(current_price, self.target_price)
+
+    def check_ticks(self, current_price_ticks: int) -> bool:
+        """Check the rule against a price in integer ticks.
+
+        Fast path for feeds that already work in 1/10000-unit ticks
+        (see TICKS_PER_UNIT): the comparison is plain int arithmetic with
+        no Decimal involved.
+
+        Args:
+            current_price_ticks: Current market price in ticks.
+
+        Returns:
+            True if rule condition is met.
+        """
+        if not self.enabled or self.triggered:
+            return False
+
+        return self._cmp(current_price_ticks, self._target_ticks)
 
     def to_dict(self) -> dict:
         """Convert rule to dictionary for serialization."""
         return {
             "id": self.id,
             "symbol": self.symbol,
-            "action": self.action.value,
-            "condition": self.condition.value,
+            "action": _ACTION_VALUE[self.action],
+            "condition": _CONDITION_VALUE[self.condition],
             "target_price": str(self.target_price),
             "quantity": self.quantity,
             "enabled": self.enabled,
@@ -84,21 +142,119 @@ class Rule:
     @classmethod
     def from_dict(cls, data: dict) -> "Rule":
         """Create rule from dictionary."""
+        # data.get with a default would generate a uuid even when an id is
+        # present; only pay for one when it's actually needed
+        rule_id = data.get("id") or uuid.uuid4().hex[:8]
+        target_price = data["target_price"]
+        if not isinstance(target_price, Decimal):
+            target_price = Decimal(str(target_price))
         return cls(
-            id=data.get("id", str(uuid.uuid4())[:8]),
+            id=rule_id,
             symbol=data["symbol"],
-            action=RuleAction(data["action"]),
-            condition=RuleCondition(data["condition"]),
-            target_price=Decimal(str(data["target_price"])),
+            action=_ACTION_BY_VALUE[data["action"]],
+            condition=_CONDITION_BY_VALUE[data["condition"]],
+            target_price=target_price,
             quantity=int(data["quantity"]),
             enabled=data.get("enabled", True),
             triggered=data.get("triggered", False),
             description=data.get("description"),
         )
 
+    @classmethod
+    def from_dict_fast(cls, data: dict) -> "Rule":
+        """Create rule from a trusted dictionary, bypassing validation.
+
+        Intended for data the system wrote itself (the rules file), where
+        the symbol is already upper-cased and values are known valid.
+        Skips __init__/__post_init__ entirely, which roughly halves
+        deserialization cost on every rules load.
+        """
+        get = data.get
+        rule = object.__new__(cls)
+        rule.id = data["id"]
+        rule.symbol = data["symbol"]
+        rule.action = _ACTION_BY_VALUE[data["action"]]
+        rule.condition = _CONDITION_BY_VALUE[data["condition"]]
+        rule.target_price = Decimal(data["target_price"])
+        rule.target_price_f = float(rule.target_price)
+        rule._target_ticks = int(
+            (rule.target_price * TICKS_PER_UNIT).to_integral_value(rounding=ROUND_HALF_UP)
+        )
+        rule._sign = -1 if rule.condition == RuleCondition.BELOW else 1
+        rule._cmp = le if rule._sign < 0 else ge
+        rule.quantity = data["quantity"]
+        rule.enabled = get("enabled", True)
+        rule.triggered = get("triggered", False)
+        rule.description = get("description")
+        return rule
+
     def __str__(self) -> str:
         """Human-readable representation."""
-        action = self.action.value.upper()
-        cond = "≤" if self.condition == RuleCondition.BELOW else "≥"
+        action = _ACTION_VALUE[self.action].upper()
+        cond = _CONDITION_GLYPH[self.condition]
         status = "✓" if self.enabled else "✗"
         return f"[{status}] {action} {self.quantity} {self.symbol} when price {cond} ${self.target_price}"
+
+
+class RuleTable:
+    """Structure-of-arrays view over a list of rules for batch evaluation.
+
+    Packs each rule's float target, condition direction (+1 ABOVE, -1 BELOW)
+    and active flag into contiguous NumPy arrays so one price vector can be
+    checked against every rule in a single vectorized pass, instead of one
+    Python-level Rule.check call per rule per tick.
+    """
+
+    def __init__(self, rules: list[Rule]) -> None:
+        """Build the table from a list of rules.
+
+        Args:
+            rules: Rules to pack; kept for mapping fired indices back.
+        """
+        self.rules = rules
+        self.targets = np.array([r.target_price_f for r in rules])
+        self.directions = np.array([r._sign for r in rules], dtype=np.int8)
+        self.active_mask = np.array([r.enabled and not r.triggered for r in rules], dtype=bool)
+        # Reused buffers so per-tick checks don't allocate
+        self._out = np.empty(len(rules), dtype=bool)
+        self._diff = np.empty(len(rules))
+
+    @classmethod
+    def from_rules(cls, rules: list[Rule]) -> "RuleTable":
+        """Create a table from any iterable of rules."""
+        return cls(list(rules))
+
+    def check_all(self, prices: np.ndarray) -> np.ndarray:
+        """Check every rule against its aligned current price.
+
+        Args:
+            prices: Float array of current prices, one per rule in table order.
+
+        Returns:
+            Boolean array, True where the rule's condition is met.
+        """
+        if _check_all_kernel is not None:
+            return _check_all_kernel(
+                prices, self.targets, self.directions, self.active_mask, self._out
+            )
+        # NumPy fallback through the reused buffers, keeping the per-tick
+        # path allocation-free for predictable latency
+        diff = np.subtract(prices, self.targets, out=self._diff)
+        diff *= self.directions
+        out = np.greater_equal(diff, 0.0, out=self._out)
+        out &= self.active_mask
+        return out
+
+    def fired_indices(self, prices: np.ndarray) -> np.ndarray:
+        """Get indices of rules whose condition is met.
+
+        Args:
+            prices: Float array of current prices, one per rule in table order.
+
+        Returns:
+            Array of integer indices into self.rules.
+        """
+        return np.flatnonzero(self.check_all(prices))
+
+    def __len__(self) -> int:
+        return len(self.rules)